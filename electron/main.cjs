@@ -9,7 +9,6 @@ const {
   buildAboutPanelOptions,
 } = require("./identity.cjs");
 const {
-  AVAILABLE_MODELS,
   DEFAULT_MODEL,
   DEFAULT_OVERLAY_SETTINGS,
   OVERLAY_WINDOW_SIZE,
@@ -30,12 +29,19 @@ const {
   deleteModelFile,
   downloadModelFile,
   listModels,
+  requireModelById,
   transcribeAudioFile,
 } = require("./whisper-engine.cjs");
 
 const DEV_SERVER_URL = process.env.VITE_DEV_SERVER_URL || "http://127.0.0.1:4270";
+const MAIN_PRELOAD_PATH = path.join(__dirname, "preload.cjs");
+const OVERLAY_PRELOAD_PATH = path.join(__dirname, "overlay-preload.cjs");
+const PACKAGED_INDEX_PATH = path.join(__dirname, "../dist/index.html");
 const MAIN_WINDOW_SIZE = { width: 780, height: 520 };
 const MAIN_WINDOW_BACKGROUND = "#2f2f2f";
+const LINUX_WINDOW_ICON_SIZE = 256;
+const OVERLAY_POSITION_SAVE_DELAY_MS = 250;
+const EMPTY_WAVEFORM_FRAME = Object.freeze([]);
 const SCREENSHOT_MODE = process.env.ASRPRO_SCREENSHOT_MODE === "1";
 const execFileAsync = promisify(execFile);
 const TEXT_EDITOR_OPTIONS = Object.freeze([
@@ -74,10 +80,20 @@ const DEFAULT_APP_SETTINGS = Object.freeze({
   startupExecutablePath: "",
 });
 const textEditorIconDataUrlCache = new Map();
+const trayIconCache = new Map();
+const trayIconPaths = new Map();
+const trayMenus = new Map();
 
 let mainWindow;
 let overlayWindow;
 let tray;
+let appIcon;
+let windowIcon;
+let trayIconUsesDarkColors;
+let runtimeAssetRoot;
+let macAppBundleNames;
+let recordingOverlayUrl;
+let textEditorOptions;
 let containedDataDir;
 let isQuitting = false;
 let isRecording = false;
@@ -85,7 +101,8 @@ let shortcutRegistered = false;
 let overlaySettings = DEFAULT_OVERLAY_SETTINGS;
 let appSettings = DEFAULT_APP_SETTINGS;
 let positioningOverlay = false;
-let lastWaveformFrame = [];
+let overlayPositionSaveTimer;
+let lastWaveformFrame = EMPTY_WAVEFORM_FRAME;
 let engineState = {
   status: "idle",
   mode: "native-node",
@@ -161,10 +178,10 @@ function createWindow() {
     maximizable: false,
     fullscreenable: false,
     title: APP_NAME,
-    icon: resolveAppIconPath(process.platform, getRuntimeAssetRoot()),
+    icon: createWindowIcon(),
     backgroundColor: MAIN_WINDOW_BACKGROUND,
     webPreferences: {
-      preload: path.join(__dirname, "preload.cjs"),
+      preload: MAIN_PRELOAD_PATH,
       contextIsolation: true,
       nodeIntegration: false,
       sandbox: false,
@@ -196,7 +213,7 @@ function createWindow() {
   mainWindow.webContents.session.clearCache().catch(() => {});
 
   if (app.isPackaged) {
-    mainWindow.loadFile(path.join(__dirname, "../dist/index.html"));
+    mainWindow.loadFile(PACKAGED_INDEX_PATH);
   } else {
     mainWindow.loadURL(DEV_SERVER_URL);
   }
@@ -237,8 +254,11 @@ function lockMainWindowSize(win) {
 function showMainWindow() {
   const win = createWindow();
   if (win.isMinimized()) win.restore();
-  win.show();
-  win.focus();
+  if (win.isVisible()) {
+    win.focus();
+  } else {
+    win.show();
+  }
 }
 
 function registerIpc() {
@@ -257,7 +277,7 @@ function registerIpc() {
     version: app.getVersion(),
   }));
 
-  ipcMain.handle("runtime:state", () => getRuntimeState());
+  ipcMain.handle("runtime:state", getRuntimeState);
 
   ipcMain.handle("engine:state", () => engineState);
 
@@ -398,16 +418,42 @@ function createTray() {
 }
 
 function createTrayIcon() {
-  const iconPath = resolveTrayIconPath(process.platform, getRuntimeAssetRoot(), nativeTheme.shouldUseDarkColors);
+  trayIconUsesDarkColors = nativeTheme.shouldUseDarkColors;
+  const iconPath = getTrayIconPath(trayIconUsesDarkColors);
+  if (trayIconCache.has(iconPath)) {
+    return trayIconCache.get(iconPath);
+  }
+
   const icon = nativeImage.createFromPath(iconPath);
   if (process.platform === "darwin") {
     icon.setTemplateImage(true);
   }
+  trayIconCache.set(iconPath, icon);
   return icon;
 }
 
+function getTrayIconPath(useDarkColors) {
+  if (!trayIconPaths.has(useDarkColors)) {
+    trayIconPaths.set(useDarkColors, resolveTrayIconPath(process.platform, getRuntimeAssetRoot(), useDarkColors));
+  }
+  return trayIconPaths.get(useDarkColors);
+}
+
 function createAppIcon() {
-  return nativeImage.createFromPath(resolveAppIconPath(process.platform, getRuntimeAssetRoot()));
+  if (!appIcon) {
+    appIcon = nativeImage.createFromPath(resolveAppIconPath(process.platform, getRuntimeAssetRoot()));
+  }
+  return appIcon;
+}
+
+function createWindowIcon() {
+  if (!windowIcon) {
+    // X11 copies the raw window icon pixels into a window property, so hand it a small icon once.
+    windowIcon = process.platform === "linux"
+      ? createAppIcon().resize({ width: LINUX_WINDOW_ICON_SIZE, height: LINUX_WINDOW_ICON_SIZE, quality: "best" })
+      : createAppIcon();
+  }
+  return windowIcon;
 }
 
 function setMacDockIcon() {
@@ -416,32 +462,47 @@ function setMacDockIcon() {
 }
 
 function getRuntimeAssetRoot() {
-  return resolveRuntimeAssetRoot({
-    isPackaged: app.isPackaged,
-    resourcesPath: process.resourcesPath,
-    appPath: app.getAppPath(),
-  });
+  if (!runtimeAssetRoot) {
+    runtimeAssetRoot = resolveRuntimeAssetRoot({
+      isPackaged: app.isPackaged,
+      resourcesPath: process.resourcesPath,
+      appPath: app.getAppPath(),
+    });
+  }
+  return runtimeAssetRoot;
 }
 
 function updateTrayIcon() {
   if (!tray) return;
+  // nativeTheme "updated" also fires for contrast and transparency changes; only the dark flag picks the icon.
+  if (nativeTheme.shouldUseDarkColors === trayIconUsesDarkColors) return;
   tray.setImage(createTrayIcon());
 }
 
 function updateTrayMenu() {
   if (!tray) return;
+  tray.setContextMenu(getTrayMenu(isRecording));
+}
+
+function getTrayMenu(recording) {
+  if (!trayMenus.has(recording)) {
+    trayMenus.set(recording, Menu.buildFromTemplate([
+      { label: `Show ${APP_NAME}`, click: showMainWindow },
+      { type: "separator" },
+      {
+        label: recording ? "Stop Recording" : "Start Recording",
+        accelerator: RECORDING_SHORTCUT,
+        click: toggleRecordingFromTray,
+      },
+      { type: "separator" },
+      { label: `Quit ${APP_NAME}`, click: quitApp },
+    ]));
+  }
+  return trayMenus.get(recording);
+}
 
-  tray.setContextMenu(Menu.buildFromTemplate([
-    { label: `Show ${APP_NAME}`, click: showMainWindow },
-    { type: "separator" },
-    {
-      label: isRecording ? "Stop Recording" : "Start Recording",
-      accelerator: RECORDING_SHORTCUT,
-      click: () => setRecording(!isRecording, "tray"),
-    },
-    { type: "separator" },
-    { label: `Quit ${APP_NAME}`, click: quitApp },
-  ]));
+function toggleRecordingFromTray() {
+  setRecording(!isRecording, "tray");
 }
 
 function getRecordingState(source = "app") {
@@ -476,37 +537,42 @@ async function getRuntimeState() {
   };
 }
 
-async function getTextEditorOptions() {
-  return Promise.all(TEXT_EDITOR_OPTIONS.map(async (editor) => {
-    return {
-      id: editor.id,
-      label: editor.label,
-      detail: editor.detail,
-      iconDataUrl: await getTextEditorIconDataUrl(editor),
-    };
-  }));
+function getTextEditorOptions() {
+  if (!textEditorOptions) {
+    textEditorOptions = Promise.all(TEXT_EDITOR_OPTIONS.map(async (editor) => {
+      return {
+        id: editor.id,
+        label: editor.label,
+        detail: editor.detail,
+        iconDataUrl: await getTextEditorIconDataUrl(editor),
+      };
+    }));
+  }
+
+  return textEditorOptions;
 }
 
-async function getTextEditorIconDataUrl(editor) {
-  if (textEditorIconDataUrlCache.has(editor.id)) {
-    return textEditorIconDataUrlCache.get(editor.id);
+function getTextEditorIconDataUrl(editor) {
+  if (!textEditorIconDataUrlCache.has(editor.id)) {
+    textEditorIconDataUrlCache.set(editor.id, loadTextEditorIconDataUrl(editor));
   }
 
-  let iconDataUrl = "";
+  return textEditorIconDataUrlCache.get(editor.id);
+}
+
+async function loadTextEditorIconDataUrl(editor) {
   try {
     const iconTarget = getTextEditorIconTarget(editor);
-    if (iconTarget) {
-      const icon = await app.getFileIcon(iconTarget, { size: "normal" });
-      if (!icon.isEmpty()) {
-        iconDataUrl = icon.resize({ width: 32, height: 32 }).toDataURL();
-      }
-    }
+    if (!iconTarget) return "";
+
+    const icon = await app.getFileIcon(iconTarget, { size: "normal" });
+    if (icon.isEmpty()) return "";
+
+    const { width, height } = icon.getSize();
+    return (width === 32 && height === 32 ? icon : icon.resize({ width: 32, height: 32 })).toDataURL();
   } catch {
-    iconDataUrl = "";
+    return "";
   }
-
-  textEditorIconDataUrlCache.set(editor.id, iconDataUrl);
-  return iconDataUrl;
 }
 
 function getTextEditorIconTarget(editor) {
@@ -515,16 +581,9 @@ function getTextEditorIconTarget(editor) {
   }
 
   if (process.platform === "darwin" && Array.isArray(editor.macBundleNames)) {
-    const appDirectories = [
-      "/Applications",
-      "/System/Applications",
-      path.join(app.getPath("home"), "Applications"),
-    ];
-
-    for (const appDirectory of appDirectories) {
+    for (const [appDirectory, bundleNames] of getMacAppBundleNames()) {
       for (const bundleName of editor.macBundleNames) {
-        const bundlePath = path.join(appDirectory, bundleName);
-        if (fs.existsSync(bundlePath)) return bundlePath;
+        if (bundleNames.has(bundleName)) return path.join(appDirectory, bundleName);
       }
     }
   }
@@ -532,11 +591,23 @@ function getTextEditorIconTarget(editor) {
   return "";
 }
 
+function getMacAppBundleNames() {
+  if (!macAppBundleNames) {
+    macAppBundleNames = new Map();
+    for (const appDirectory of ["/Applications", "/System/Applications", path.join(app.getPath("home"), "Applications")]) {
+      try {
+        macAppBundleNames.set(appDirectory, new Set(fs.readdirSync(appDirectory)));
+      } catch {
+        macAppBundleNames.set(appDirectory, new Set());
+      }
+    }
+  }
+  return macAppBundleNames;
+}
+
 function ensureSystemTextIconProbe() {
   const probePath = path.join(containedDataDir, "config", "text-editor-icon-probe.txt");
-  if (!fs.existsSync(probePath)) {
-    fs.writeFileSync(probePath, "", "utf8");
-  }
+  fs.closeSync(fs.openSync(probePath, "a"));
   return probePath;
 }
 
@@ -572,10 +643,7 @@ function toAudioBuffer(audioData) {
 }
 
 async function downloadModel(request = {}) {
-  const model = AVAILABLE_MODELS.find((candidate) => candidate.id === request.modelId);
-  if (!model) {
-    throw new Error(`Unsupported recognition model: ${request.modelId}`);
-  }
+  const model = requireModelById(request.modelId);
 
   try {
     await downloadModelFile({
@@ -608,10 +676,7 @@ async function downloadModel(request = {}) {
 }
 
 async function deleteModel(request = {}) {
-  const model = AVAILABLE_MODELS.find((candidate) => candidate.id === request.modelId);
-  if (!model) {
-    throw new Error(`Unsupported recognition model: ${request.modelId}`);
-  }
+  const model = requireModelById(request.modelId);
 
   if ((engineState.status === "downloading" || engineState.status === "transcribing") && engineState.modelId === model.id) {
     throw new Error(`${model.displayName} is currently in use.`);
@@ -627,10 +692,7 @@ async function deleteModel(request = {}) {
 
 async function transcribeAudio(request = {}) {
   const modelId = request.modelId || DEFAULT_MODEL.id;
-  const model = AVAILABLE_MODELS.find((candidate) => candidate.id === modelId);
-  if (!model) {
-    throw new Error(`Unsupported recognition model: ${modelId}`);
-  }
+  const model = requireModelById(modelId);
 
   const { tempDir, filePath } = createTempAudioPath(request.mimeType);
   try {
@@ -683,10 +745,9 @@ async function openTranscriptText(request = {}) {
   const title = typeof request.title === "string" && request.title.trim() ? request.title : "Transcript";
   const text = typeof request.text === "string" ? request.text.trim() : "";
   const transcriptDir = getTranscriptDir();
-  const filePath = getTranscriptTextPath(title);
+  const filePath = getTranscriptTextPath(title, transcriptDir);
 
-  fs.mkdirSync(transcriptDir, { recursive: true });
-  fs.writeFileSync(filePath, `${text || "No transcript text available."}\n`, "utf8");
+  writeTranscriptTextFile(transcriptDir, filePath, `${text || "No transcript text available."}\n`);
 
   await openTranscriptFile(filePath, appSettings.defaultTextEditor);
 
@@ -697,8 +758,19 @@ function getTranscriptDir() {
   return path.join(containedDataDir, "transcripts");
 }
 
-function getTranscriptTextPath(title) {
-  return path.join(getTranscriptDir(), `${sanitizeTranscriptFileName(title)}.txt`);
+function getTranscriptTextPath(title, transcriptDir = getTranscriptDir()) {
+  return path.join(transcriptDir, `${sanitizeTranscriptFileName(title)}.txt`);
+}
+
+function writeTranscriptTextFile(transcriptDir, filePath, contents) {
+  try {
+    fs.writeFileSync(filePath, contents, "utf8");
+  } catch (error) {
+    // The transcripts directory is created at startup; only recreate it if it was removed since.
+    if (error?.code !== "ENOENT") throw error;
+    fs.mkdirSync(transcriptDir, { recursive: true });
+    fs.writeFileSync(filePath, contents, "utf8");
+  }
 }
 
 async function deleteTranscriptText(request = {}) {
@@ -714,7 +786,7 @@ function resolveTranscriptDeletePath(request = {}) {
   const requestedFilePath = typeof request.filePath === "string" ? request.filePath.trim() : "";
   const filePath = requestedFilePath
     ? path.resolve(requestedFilePath)
-    : getTranscriptTextPath(typeof request.title === "string" && request.title.trim() ? request.title : "Transcript");
+    : getTranscriptTextPath(typeof request.title === "string" && request.title.trim() ? request.title : "Transcript", transcriptDir);
 
   if (!isPathInside(transcriptDir, filePath)) {
     throw new Error("Transcript file path is outside ASR Pro data.");
@@ -815,7 +887,7 @@ function showRecordingOverlay() {
     hasShadow: false,
     backgroundColor: "#00000000",
     webPreferences: {
-      preload: path.join(__dirname, "overlay-preload.cjs"),
+      preload: OVERLAY_PRELOAD_PATH,
       contextIsolation: true,
       nodeIntegration: false,
       sandbox: true,
@@ -834,13 +906,21 @@ function showRecordingOverlay() {
   overlayWindow.on("closed", () => {
     overlayWindow = undefined;
   });
-  overlayWindow.loadURL(`data:text/html;charset=UTF-8,${encodeURIComponent(createRecordingOverlayHtml({
-    modelName: DEFAULT_MODEL.displayName,
-    shortcut: RECORDING_SHORTCUT,
-  }))}`);
+  overlayWindow.loadURL(getRecordingOverlayUrl());
+}
+
+function getRecordingOverlayUrl() {
+  if (!recordingOverlayUrl) {
+    recordingOverlayUrl = `data:text/html;charset=UTF-8,${encodeURIComponent(createRecordingOverlayHtml({
+      modelName: DEFAULT_MODEL.displayName,
+      shortcut: RECORDING_SHORTCUT,
+    }))}`;
+  }
+  return recordingOverlayUrl;
 }
 
 function hideRecordingOverlay() {
+  flushDraggedOverlayPosition();
   if (overlayWindow && !overlayWindow.isDestroyed()) {
     overlayWindow.close();
   }
@@ -848,9 +928,9 @@ function hideRecordingOverlay() {
 }
 
 function updateOverlayWaveformFrame(frame) {
-  const normalizedFrame = Array.isArray(frame)
+  const normalizedFrame = Array.isArray(frame) && frame.length > 0
     ? frame.slice(0, 80).map((value) => Math.min(Math.max(Number(value) || 0, 0), 1))
-    : [];
+    : EMPTY_WAVEFORM_FRAME;
 
   lastWaveformFrame = normalizedFrame;
 
@@ -1072,9 +1152,11 @@ function getLoginItemOptions(executablePath) {
 
 function getLinuxStartupLaunchState(executablePath) {
   const autostartPath = getLinuxAutostartFilePath();
-  const registeredExecutablePath = readLinuxAutostartExecutablePath(autostartPath);
-  const enabled = fs.existsSync(autostartPath)
-    && !readTextFile(autostartPath).includes("X-GNOME-Autostart-enabled=false")
+  const hasAutostartEntry = fs.existsSync(autostartPath);
+  const source = hasAutostartEntry ? readTextFile(autostartPath) : "";
+  const registeredExecutablePath = parseLinuxAutostartExecutablePath(source);
+  const enabled = hasAutostartEntry
+    && !source.includes("X-GNOME-Autostart-enabled=false")
     && registeredExecutablePath === executablePath;
 
   return {
@@ -1104,15 +1186,14 @@ function getLinuxAutostartFilePath() {
   return path.join(configHome, "autostart", "asrpro.desktop");
 }
 
-function readLinuxAutostartExecutablePath(autostartPath) {
-  const source = readTextFile(autostartPath);
+function parseLinuxAutostartExecutablePath(source) {
   const execLine = source.split(/\r?\n/).find((line) => line.startsWith("Exec="));
   if (!execLine) return "";
 
   const execValue = execLine.slice("Exec=".length).trim();
   const quotedMatch = execValue.match(/^"((?:\\.|[^"])*)"/);
   if (quotedMatch) {
-    return quotedMatch[1].replace(/\\"/g, '"').replace(/\\\\/g, "\\");
+    return quotedMatch[1].replace(/\\(["\\])/g, "$1");
   }
 
   return execValue.split(/\s+/)[0] || "";
@@ -1136,6 +1217,15 @@ function positionRecordingOverlay() {
     width: OVERLAY_WINDOW_SIZE.width,
     height: OVERLAY_WINDOW_SIZE.height,
   });
+  const currentBounds = overlayWindow.getBounds();
+  if (
+    currentBounds.x === bounds.x
+    && currentBounds.y === bounds.y
+    && currentBounds.width === OVERLAY_WINDOW_SIZE.width
+    && currentBounds.height === OVERLAY_WINDOW_SIZE.height
+  ) {
+    return;
+  }
 
   positioningOverlay = true;
   overlayWindow.setBounds({
@@ -1160,6 +1250,16 @@ function persistDraggedOverlayPosition() {
       y: bounds.y,
     },
   });
+
+  // A drag fires "move" for every pointer step; write the settings file once it settles.
+  clearTimeout(overlayPositionSaveTimer);
+  overlayPositionSaveTimer = setTimeout(flushDraggedOverlayPosition, OVERLAY_POSITION_SAVE_DELAY_MS);
+}
+
+function flushDraggedOverlayPosition() {
+  if (!overlayPositionSaveTimer) return;
+  clearTimeout(overlayPositionSaveTimer);
+  overlayPositionSaveTimer = undefined;
   saveOverlaySettings();
 }
 
@@ -1199,9 +1299,12 @@ if (hasSingleInstanceLock) {
     setMacDockIcon();
     createWindow();
     if (!SCREENSHOT_MODE) {
-      registerGlobalShortcut();
-      createTray();
-      nativeTheme.on("updated", updateTrayIcon);
+      // Let the window start loading before the shortcut and tray are wired up.
+      setImmediate(() => {
+        registerGlobalShortcut();
+        createTray();
+        nativeTheme.on("updated", updateTrayIcon);
+      });
     }
 
     app.on("activate", showMainWindow);
@@ -3,6 +3,7 @@ const fs = require("node:fs");
 const {
   AVAILABLE_MODELS,
   DEFAULT_MODEL,
+  getModelById,
   getModelPath,
   getWhisperModelsDir,
 } = require("./whisper-engine.cjs");
@@ -18,6 +19,7 @@ const DEFAULT_OVERLAY_SETTINGS = Object.freeze({
   customBounds: null,
 });
 const PORTABLE_DATA_DIR_NAME = "asrpro-data";
+const OVERLAY_WAVEFORM_BARS_HTML = buildOverlayWaveformBarsHtml(44);
 
 function platformPath(platform) {
   return platform === "win32" ? path.win32 : path.posix;
@@ -98,7 +100,7 @@ function buildLinuxAutostartDesktopEntry({ appName = "ASR Pro", executablePath =
 }
 
 function quoteDesktopExecPath(value) {
-  return `"${String(value).replace(/\\/g, "\\\\").replace(/"/g, '\\"')}"`;
+  return `"${String(value).replace(/["\\]/g, "\\$&")}"`;
 }
 
 function resolveRuntimeAssetRoot({ isPackaged, resourcesPath, appPath }) {
@@ -133,7 +135,7 @@ function collectRuntimeStorageStats(dataDir, memoryUsage = process.memoryUsage()
   const paths = buildModelPaths(dataDir);
   const transcriptDir = path.join(dataDir, "transcripts");
   const configDir = path.join(dataDir, "config");
-  const model = AVAILABLE_MODELS.find((candidate) => candidate.id === modelId) || DEFAULT_MODEL;
+  const model = getModelById(modelId);
   const modelBytes = getPathSizeBytes(paths.whisperModelsDir);
   const activeModelBytes = getPathSizeBytes(getModelPath(dataDir, model.id));
   const transcriptBytes = getPathSizeBytes(transcriptDir);
@@ -306,15 +308,10 @@ function getDisplayWorkArea(display) {
 
 function clamp(value, min, max) {
   if (max < min) return Math.round(min);
-  return Math.round(Math.min(Math.max(value, min), max));
+  return Math.round(clampNumber(value, min, max));
 }
 
 function createRecordingOverlayHtml() {
-  const waveformBars = buildOverlayWaveformBars(44);
-  const barsHtml = waveformBars.map((height, index) => (
-    `<span data-base="${height}" style="--bar-height:${height}px;--bar-opacity:${edgeOpacity(index, waveformBars.length)}"></span>`
-  )).join("");
-
   return `<!doctype html>
 <html>
   <head>
@@ -354,8 +351,6 @@ function createRecordingOverlayHtml() {
           0 12px 26px rgba(0, 0, 0, 0.32),
           inset 0 1px 0 rgba(90, 90, 96, 0.14),
           inset 0 -1px 0 rgba(0, 0, 0, 0.42);
-        backdrop-filter: saturate(180%) blur(20px);
-        -webkit-backdrop-filter: saturate(180%) blur(20px);
         -webkit-app-region: drag;
       }
       .waveform {
@@ -367,6 +362,7 @@ function createRecordingOverlayHtml() {
         width: 132px;
         height: 20px;
         overflow: hidden;
+        will-change: transform;
         mask-image: linear-gradient(90deg, transparent, #000 6%, #000 94%, transparent);
         -webkit-mask-image: linear-gradient(90deg, transparent, #000 6%, #000 94%, transparent);
       }
@@ -376,21 +372,25 @@ function createRecordingOverlayHtml() {
         border-radius: 999px;
         background: rgba(230, 230, 234, var(--bar-opacity));
         transform-origin: center;
-        will-change: height, background;
       }
     </style>
   </head>
   <body>
     <div class="surface" role="status" aria-label="ASR Pro recording overlay">
-      <span class="waveform" aria-hidden="true">${barsHtml}</span>
+      <span class="waveform" aria-hidden="true">${OVERLAY_WAVEFORM_BARS_HTML}</span>
     </div>
     <script>
       (() => {
         const bars = Array.from(document.querySelectorAll(".waveform span"));
         const bases = bars.map((bar) => Number(bar.dataset.base) || 8);
+        const baseOpacities = bars.map((bar) => Number(bar.style.getPropertyValue("--bar-opacity")) || 0.72);
         const clamp = (value, min, max) => Math.min(Math.max(value, min), max);
+        const floors = bases.map((base) => clamp(base * 0.72, 4, 14));
+        const ripplePhases = bases.map((_, index) => index * 0.72);
         const current = bases.map(() => 0);
         const target = bases.map(() => 0);
+        const renderedHeights = bases.map(() => "");
+        const renderedOpacities = bases.map(() => "");
         let animationFrame = 0;
         let lastInputAt = 0;
 
@@ -410,18 +410,28 @@ function createRecordingOverlayHtml() {
 
             const base = bases[index];
             const energy = clamp(current[index], 0, 1);
-            const ripple = energy * 0.045 * Math.sin(now * 0.018 + index * 0.72);
+            const ripple = energy * 0.045 * Math.sin(now * 0.018 + ripplePhases[index]);
             const level = clamp(energy + ripple, 0, 1);
-            const floor = clamp(base * 0.72, 4, 14);
+            const floor = floors[index];
             const height = energy > 0.002 || desired > 0.002 ? clamp(floor + level * (20 - floor), 4, 20) : base;
-            const opacity = energy > 0.002 ? clamp(0.42 + level * 0.54, 0.34, 0.96) : Number(bar.dataset.opacity) || 0.72;
+            const opacity = energy > 0.002 ? clamp(0.42 + level * 0.54, 0.34, 0.96) : baseOpacities[index];
 
             if (energy > 0.002 || desired > 0.002) {
               shouldContinue = true;
             }
 
-            bar.style.setProperty("--bar-height", height.toFixed(2) + "px");
-            bar.style.setProperty("--bar-opacity", opacity.toFixed(3));
+            const nextHeight = height.toFixed(2) + "px";
+            const nextOpacity = opacity.toFixed(3);
+
+            if (renderedHeights[index] !== nextHeight) {
+              renderedHeights[index] = nextHeight;
+              bar.style.setProperty("--bar-height", nextHeight);
+            }
+
+            if (renderedOpacities[index] !== nextOpacity) {
+              renderedOpacities[index] = nextOpacity;
+              bar.style.setProperty("--bar-opacity", nextOpacity);
+            }
           });
 
           if (shouldContinue) {
@@ -448,10 +458,6 @@ function createRecordingOverlayHtml() {
           startWaveform();
         };
 
-        bars.forEach((bar) => {
-          bar.dataset.opacity = bar.style.getPropertyValue("--bar-opacity") || "0.72";
-        });
-
         window.asrproSetWaveformFrame = setWaveformFrame;
         window.asrproOverlay?.onWaveformFrame?.(setWaveformFrame);
       })();
@@ -473,6 +479,12 @@ function buildOverlayWaveformBars(count) {
   });
 }
 
+function buildOverlayWaveformBarsHtml(count) {
+  return buildOverlayWaveformBars(count).map((height, index) => (
+    `<span data-base="${height}" style="--bar-height:${height}px;--bar-opacity:${edgeOpacity(index, count)}"></span>`
+  )).join("");
+}
+
 function edgeOpacity(index, count) {
   const distance = Math.min(index, count - 1 - index);
   if (distance < 3) return 0.28 + distance * 0.12;
@@ -1,11 +1,11 @@
 const crypto = require("node:crypto");
 const fs = require("node:fs");
-const https = require("node:https");
 const os = require("node:os");
 const path = require("node:path");
 const { promisify } = require("node:util");
 
 const WHISPER_MODEL_BASE_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main";
+const WHISPER_THREAD_COUNT = Math.max(2, Math.min(os.cpus().length, 8));
 
 const AVAILABLE_MODELS = Object.freeze([
   {
@@ -56,16 +56,18 @@ const AVAILABLE_MODELS = Object.freeze([
 ]);
 
 const DEFAULT_MODEL = AVAILABLE_MODELS[1];
+const MODELS_BY_ID = new Map(AVAILABLE_MODELS.map((model) => [model.id, model]));
 
 let addon;
+let https;
 const modelDownloadPromises = new Map();
 
 function getModelById(modelId) {
-  return AVAILABLE_MODELS.find((model) => model.id === modelId) || DEFAULT_MODEL;
+  return MODELS_BY_ID.get(modelId) || DEFAULT_MODEL;
 }
 
 function requireModelById(modelId) {
-  const model = AVAILABLE_MODELS.find((candidate) => candidate.id === modelId);
+  const model = MODELS_BY_ID.get(modelId);
   if (!model) {
     throw new Error(`Unsupported recognition model: ${modelId}`);
   }
@@ -82,21 +84,26 @@ function getModelPath(dataDir, modelId = DEFAULT_MODEL.id) {
 }
 
 function listModels(dataDir) {
-  return AVAILABLE_MODELS.map((model) => ({
+  return AVAILABLE_MODELS.map((model) => describeModel(model, dataDir));
+}
+
+function describeModel(model, dataDir) {
+  const modelPath = getModelPath(dataDir, model.id);
+  const modelStats = getModelFileStats(modelPath);
+  return {
     ...model,
-    path: getModelPath(dataDir, model.id),
-    installed: fs.existsSync(getModelPath(dataDir, model.id)),
-    diskBytes: getModelFileSize(dataDir, model.id),
+    path: modelPath,
+    installed: Boolean(modelStats),
+    diskBytes: modelStats ? modelStats.size : 0,
     downloadUrl: `${WHISPER_MODEL_BASE_URL}/${model.fileName}`,
-  }));
+  };
 }
 
-function getModelFileSize(dataDir, modelId) {
-  const modelPath = getModelPath(dataDir, modelId);
+function getModelFileStats(modelPath) {
   try {
-    return fs.statSync(modelPath).size;
+    return fs.statSync(modelPath, { throwIfNoEntry: false });
   } catch {
-    return 0;
+    return undefined;
   }
 }
 
@@ -111,6 +118,14 @@ function loadAddon() {
   return addon;
 }
 
+function loadHttps() {
+  if (!https) {
+    // Only model downloads need the TLS stack, so keep it off the app startup path.
+    https = require("node:https");
+  }
+  return https;
+}
+
 function loadAddonFromPackagedBinary(originalError) {
   const packageRoot = path.dirname(require.resolve("@kutalia/whisper-node-addon/package.json"));
   const nativeDir = getNativeAddonDir();
@@ -194,7 +209,7 @@ async function downloadModelFile({ modelId, dataDir, onState = () => {} }) {
   const model = requireModelById(modelId);
   const modelPath = await ensureModel(model, dataDir, onState);
   return {
-    model: listModels(dataDir).find((candidate) => candidate.id === model.id),
+    model: describeModel(model, dataDir),
     path: modelPath,
   };
 }
@@ -209,7 +224,7 @@ function deleteModelFile({ modelId, dataDir }) {
 
   return {
     deleted: wasInstalled,
-    model: listModels(dataDir).find((candidate) => candidate.id === model.id),
+    model: describeModel(model, dataDir),
     path: modelPath,
   };
 }
@@ -218,7 +233,7 @@ function downloadFile(url, destination, onProgress = () => {}) {
   const tempPath = `${destination}.download`;
 
   return new Promise((resolve, reject) => {
-    const request = https.get(url, (response) => {
+    const request = loadHttps().get(url, (response) => {
       if (response.statusCode >= 300 && response.statusCode < 400 && response.headers.location) {
         response.resume();
         downloadFile(response.headers.location, destination, onProgress).then(resolve, reject);
@@ -233,12 +248,18 @@ function downloadFile(url, destination, onProgress = () => {}) {
 
       const totalBytes = Number(response.headers["content-length"]) || 0;
       let downloadedBytes = 0;
+      let reportedProgress = 0;
       const output = fs.createWriteStream(tempPath);
+      const reportProgress = (progress) => {
+        if (progress === reportedProgress) return;
+        reportedProgress = progress;
+        onProgress(progress);
+      };
 
       response.on("data", (chunk) => {
         downloadedBytes += chunk.length;
         if (totalBytes > 0) {
-          onProgress(Math.round((downloadedBytes / totalBytes) * 100));
+          reportProgress(Math.round((downloadedBytes / totalBytes) * 100));
         }
       });
       response.pipe(output);
@@ -253,7 +274,7 @@ function downloadFile(url, destination, onProgress = () => {}) {
 
           try {
             fs.renameSync(tempPath, destination);
-            onProgress(100);
+            reportProgress(100);
             resolve();
           } catch (error) {
             fs.rmSync(tempPath, { force: true });
@@ -355,7 +376,7 @@ async function transcribeAudioFile({ filePath, modelId, dataDir, onState = () =>
     no_timestamps: true,
     no_prints: true,
     use_gpu: true,
-    n_threads: Math.max(2, Math.min(os.cpus().length, 8)),
+    n_threads: WHISPER_THREAD_COUNT,
   });
 
   return {
@@ -373,6 +394,7 @@ module.exports = {
   getModelPath,
   getWhisperModelsDir,
   listModels,
+  requireModelById,
   normalizeTranscriptionResult,
   loadAddon,
   downloadModelFile,
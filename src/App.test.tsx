@@ -378,14 +378,14 @@ describe("ASR Pro Electron shell", () => {
     render(<App />);
 
     const homeButton = screen.getByRole("button", { name: "Home" });
+    const historyButton = screen.getByRole("button", { name: "History" });
+    expect(homeButton.className).toContain("aria-[current=page]:bg-[#686868]");
     expect(homeButton.getAttribute("aria-current")).toBe("page");
-    expect(homeButton.className).toContain("bg-[#686868]");
+    expect(historyButton.getAttribute("aria-current")).toBeNull();
 
-    const historyButton = screen.getByRole("button", { name: "History" });
     await user.click(historyButton);
 
     expect(historyButton.getAttribute("aria-current")).toBe("page");
-    expect(historyButton.className).toContain("bg-[#686868]");
     expect(homeButton.getAttribute("aria-current")).toBeNull();
   });
 
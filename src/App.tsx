@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useMemo, useRef, useState, type ButtonHTMLAttributes, type ReactNode } from "react";
+import { memo, useCallback, useEffect, useMemo, useRef, useState, type ButtonHTMLAttributes, type MouseEvent, type ReactNode } from "react";
 import {
   Activity,
   ArrowUpRight,
@@ -145,6 +145,13 @@ interface NavItem {
   icon: LucideIcon;
 }
 
+interface WindowDot {
+  action: WindowAction;
+  label: string;
+  buttonClass: string;
+  icon: ReactNode;
+}
+
 interface TranscriptHistoryRow {
   id: string;
   title: string;
@@ -176,10 +183,20 @@ const audioInputDeviceIconByType: Record<AudioInputDeviceIconType, LucideIcon> =
   usb: Usb,
 };
 
+const audioInputDeviceIconTypeCache = new Map<string, AudioInputDeviceIconType>();
+
 function getAudioInputDeviceIconType(device: AudioInputDeviceOption): AudioInputDeviceIconType {
   const value = `${device.id} ${device.label}`.toLowerCase();
+  const cachedIconType = audioInputDeviceIconTypeCache.get(value);
+  if (cachedIconType) return cachedIconType;
+
+  const iconType = detectAudioInputDeviceIconType(device.id, value);
+  audioInputDeviceIconTypeCache.set(value, iconType);
+  return iconType;
+}
 
-  if (device.id === "default" || value.includes("system default")) return "mic";
+function detectAudioInputDeviceIconType(deviceId: string, value: string): AudioInputDeviceIconType {
+  if (deviceId === "default" || value.includes("system default")) return "mic";
   if (/(iphone|ipad|android|mobile|\bphone\b)/.test(value)) return "phone";
   if (/(macbook|built-in|builtin|internal|laptop)/.test(value)) return "laptop";
   if (/(webcam|camera|facetime|logitech|brio|c920)/.test(value)) return "webcam";
@@ -215,6 +232,47 @@ const sidebarIconTone: Record<ViewId, string> = {
   about: "bg-[#727272] text-white",
 };
 
+const sidebarNavItemClass = "mb-1 flex h-9 shrink-0 items-center gap-2 rounded-[9px] px-2.5 text-left text-[13px] font-semibold text-[#d0d0d0] transition outline-none hover:bg-[#505050] focus:outline-none focus-visible:ring-2 focus-visible:ring-[#9bcfff]/70 focus-visible:ring-offset-1 focus-visible:ring-offset-[#3c3c3c] aria-[current=page]:bg-[#686868] aria-[current=page]:text-white sm:w-full";
+const sidebarNavIconById = Object.fromEntries(
+  navItems.map(({ id, icon: Icon }) => [id, <Icon className="size-3.5" />]),
+) as Record<ViewId, ReactNode>;
+const navItemLabelById = Object.fromEntries(navItems.map((item) => [item.id, item.label])) as Record<ViewId, string>;
+const sidebarIconTileClassById = Object.fromEntries(
+  navItems.map((item) => [item.id, `grid size-5 shrink-0 place-items-center rounded-md ${sidebarIconTone[item.id]}`]),
+) as Record<ViewId, string>;
+
+const windowDotButtonClass =
+  "grid size-[13px] place-items-center rounded-full border-0 p-0 shadow-none outline-none transition-transform duration-150 [appearance:none] hover:scale-105 focus:outline-none focus-visible:outline-none focus-visible:ring-0 active:outline-none";
+const windowDotIconClass = "size-[9px] opacity-0 transition-opacity duration-100 group-hover/window-dots:opacity-75";
+const windowDots: WindowDot[] = [
+  {
+    action: "close",
+    label: "Close window",
+    buttonClass: `${windowDotButtonClass} bg-[#ff5f57]`,
+    icon: (
+      <X
+        aria-hidden="true"
+        data-window-dot-icon="close"
+        strokeWidth={2.6}
+        className={`${windowDotIconClass} text-[#6e140f]`}
+      />
+    ),
+  },
+  {
+    action: "minimize",
+    label: "Minimize window",
+    buttonClass: `${windowDotButtonClass} bg-[#febc2e]`,
+    icon: (
+      <Minus
+        aria-hidden="true"
+        data-window-dot-icon="minimize"
+        strokeWidth={3}
+        className={`${windowDotIconClass} text-[#8f5b00]`}
+      />
+    ),
+  },
+];
+
 const defaultModelName = "Whisper Base English";
 const defaultAudioInputId = "default";
 const defaultAudioInputLabel = "System default";
@@ -310,8 +368,10 @@ const historyWaveformBars = Array.from({ length: 72 }, (_, index) => {
   const shape = 0.42 + 0.2 * Math.sin(index * 1.7) + 0.16 * Math.sin(index * 0.53 + 1.1);
   return {
     id: `history-wave-${index}`,
-    index,
-    height: Math.round(clampNumber(6 + 18 * envelope * shape, 5, 24)),
+    style: {
+      height: `${Math.round(clampNumber(6 + 18 * envelope * shape, 5, 24))}px`,
+      opacity: index % 4 === 0 ? 0.35 : 0.62,
+    },
   };
 });
 
@@ -329,6 +389,29 @@ const dropdownSurfaceClass = `scrollbar-macos dropdown-options-scrollbar absolut
 const dropdownOptionButtonClass = `flex w-full min-w-0 items-start gap-2 ${insetControlRadiusClass} px-2.5 py-2 text-left text-[12px] font-semibold leading-4 transition`;
 const segmentedControlClass = `inline-flex ${sharedRadiusClass} border border-white/[0.08] bg-[#2b2b2b] p-0.5`;
 const segmentedItemClass = `h-7 ${insetControlRadiusClass} px-2.5 text-[12px] font-semibold transition ${focusRingClass}`;
+const segmentedItemClassByState = {
+  active: `${segmentedItemClass} bg-[#686868] text-white`,
+  idle: `${segmentedItemClass} text-[#aaa] hover:text-white`,
+} as const;
+const dropdownOptionButtonClassByState = {
+  selected: `${dropdownOptionButtonClass} bg-[#5a5a5a] text-white`,
+  idle: `${dropdownOptionButtonClass} text-[#dddddd] hover:bg-[#454545]`,
+} as const;
+const toggleSwitchClass = `group relative h-6 w-11 shrink-0 rounded-full border border-white/[0.1] bg-[#2b2b2b] transition aria-checked:bg-[#5f9fc6]/70 disabled:cursor-not-allowed disabled:opacity-50 ${focusRingClass}`;
+const toggleSwitchThumbClass = "absolute left-[3px] top-[3px] size-[18px] translate-x-0 rounded-full bg-[#f1f1f1] shadow-[0_1px_4px_rgba(0,0,0,0.35)] transition-transform group-aria-checked:translate-x-5";
+const modelActionButtonBaseClass = `grid size-8 shrink-0 place-items-center rounded-full border-0 bg-transparent p-0 transition active:scale-[0.96] disabled:cursor-wait disabled:opacity-55 ${focusRingClass}`;
+const modelActionButtonClassByKind: Record<ModelActionButtonProps["kind"], string> = {
+  download: `${modelActionButtonBaseClass} text-[#cfcfcf] hover:bg-[#344235] hover:text-[#bce7c9]`,
+  delete: `${modelActionButtonBaseClass} text-[#cfcfcf] hover:bg-[#4a3333] hover:text-[#ffb3aa]`,
+};
+
+const panelRowIcons = {
+  microphone: <Mic2 className="size-3.5" />,
+  history: <History className="size-3.5" />,
+  models: <Library className="size-3.5" />,
+  engine: <BrainCircuit className="size-3.5" />,
+  storage: <HardDrive className="size-3.5" />,
+};
 
 const waveformBarCount = 76;
 const waveformBaseBars = Array.from({ length: waveformBarCount }, (_, index) => {
@@ -344,9 +427,21 @@ const waveformBaseBars = Array.from({ length: waveformBarCount }, (_, index) =>
     id: `wave-${index}`,
     baseHeight: Math.round(clampNumber(10 + 42 * envelope * voiceShape, 8, 46)),
     opacity: edgeDistance < 5 ? 0.34 + edgeDistance * 0.08 : 0.78,
+    spectralPosition: Math.pow(position, 1.34),
+    liftPhase: index * 0.83,
+    slowLiftPhase: index * 1.71,
   };
 });
 const idleWaveformFrame = waveformBaseBars.map((bar) => bar.baseHeight);
+const overlayWaveformSampleCount = 55;
+const idleOverlayWaveformSamples = Object.freeze([]) as readonly number[];
+const overlayWaveformSources = Array.from({ length: overlayWaveformSampleCount }, (_, index) => {
+  const sourceIndex = Math.round((index / Math.max(1, overlayWaveformSampleCount - 1)) * (waveformBaseBars.length - 1));
+  return {
+    sourceIndex,
+    baseHeight: waveformBaseBars[sourceIndex]?.baseHeight ?? 8,
+  };
+});
 
 function clampNumber(value: number, min: number, max: number) {
   return Math.min(Math.max(value, min), max);
@@ -354,16 +449,15 @@ function clampNumber(value: number, min: number, max: number) {
 
 function buildReactiveWaveformFrame(frequencies: Uint8Array, voiceLevel: number, timestamp: number, previousFrame: number[]) {
   return waveformBaseBars.map((bar, index) => {
-    const position = index / Math.max(1, waveformBaseBars.length - 1);
-    const bin = Math.min(frequencies.length - 1, Math.floor(Math.pow(position, 1.34) * frequencies.length * 0.86));
+    const bin = Math.min(frequencies.length - 1, Math.floor(bar.spectralPosition * frequencies.length * 0.86));
     const spectralLevel = Math.max(
       frequencies[bin] / 255,
       (frequencies[Math.min(frequencies.length - 1, bin + 2)] || 0) / 255 * 0.82,
     );
     const unevenLift = clampNumber(
       0.64
-        + 0.24 * Math.sin(index * 0.83 + timestamp * 0.009)
-        + 0.18 * Math.sin(index * 1.71 + timestamp * 0.006),
+        + 0.24 * Math.sin(bar.liftPhase + timestamp * 0.009)
+        + 0.18 * Math.sin(bar.slowLiftPhase + timestamp * 0.006),
       0.42,
       1.14,
     );
@@ -375,35 +469,25 @@ function buildReactiveWaveformFrame(frequencies: Uint8Array, voiceLevel: number,
 }
 
 function toOverlayWaveformSamples(frame: number[]) {
-  const overlayCount = 55;
-  return Array.from({ length: overlayCount }, (_, index) => {
-    const sourceIndex = Math.round((index / Math.max(1, overlayCount - 1)) * (waveformBaseBars.length - 1));
-    const baseHeight = waveformBaseBars[sourceIndex]?.baseHeight ?? 8;
+  return overlayWaveformSources.map(({ sourceIndex, baseHeight }) => {
     const height = frame[sourceIndex] ?? baseHeight;
     return clampNumber(((height - baseHeight) / (64 - baseHeight)) * 1.45, 0, 1);
   });
 }
 
 function sendOverlayWaveformFrame(frame: number[], hasVoice: boolean) {
-  window.asrpro?.setWaveformFrame?.(hasVoice ? toOverlayWaveformSamples(frame) : []);
+  window.asrpro?.setWaveformFrame?.(hasVoice ? toOverlayWaveformSamples(frame) : idleOverlayWaveformSamples);
 }
 
-function scheduleWaveformFrame(callback: FrameRequestCallback) {
-  if (typeof window.requestAnimationFrame === "function") {
-    return window.requestAnimationFrame(callback);
-  }
-
-  return window.setTimeout(() => callback(performance.now()), 16);
-}
+const supportsAnimationFrame = typeof window.requestAnimationFrame === "function" && typeof window.cancelAnimationFrame === "function";
 
-function cancelWaveformFrame(id: number) {
-  if (typeof window.cancelAnimationFrame === "function") {
-    window.cancelAnimationFrame(id);
-    return;
-  }
+const scheduleWaveformFrame: (callback: FrameRequestCallback) => number = supportsAnimationFrame
+  ? (callback) => window.requestAnimationFrame(callback)
+  : (callback) => window.setTimeout(() => callback(performance.now()), 16);
 
-  window.clearTimeout(id);
-}
+const cancelWaveformFrame: (id: number) => void = supportsAnimationFrame
+  ? (id) => window.cancelAnimationFrame(id)
+  : (id) => window.clearTimeout(id);
 
 function loadSelectedAudioInputId() {
   try {
@@ -580,21 +664,22 @@ function formatDuration(seconds: number) {
   return `${minutes}:${remainingSeconds.toString().padStart(2, "0")}`;
 }
 
+const byteCountUnits = ["B", "KiB", "MiB", "GiB", "TiB"] as const;
+
 function formatByteCount(bytes?: number) {
   const value = Number(bytes);
   if (!Number.isFinite(value) || value <= 0) return "0 B";
 
-  const units = ["B", "KiB", "MiB", "GiB", "TiB"];
   let scaled = value;
   let unitIndex = 0;
 
-  while (scaled >= 1024 && unitIndex < units.length - 1) {
+  while (scaled >= 1024 && unitIndex < byteCountUnits.length - 1) {
     scaled /= 1024;
     unitIndex += 1;
   }
 
   const precision = scaled >= 10 || unitIndex === 0 ? 0 : 1;
-  return `${scaled.toFixed(precision)} ${units[unitIndex]}`;
+  return `${scaled.toFixed(precision)} ${byteCountUnits[unitIndex]}`;
 }
 
 function getRuntimeModels(models?: EngineModelInfo[]) {
@@ -619,6 +704,22 @@ function formatHistoryGroupLabel(createdAt: number, now = Date.now()) {
   return historyDateFormatter.format(new Date(createdAt));
 }
 
+function groupHistoryRowsByDay(rows: TranscriptHistoryRow[], now = Date.now()) {
+  const rowsByLabel = new Map<string, TranscriptHistoryRow[]>();
+
+  for (const row of rows) {
+    const label = formatHistoryGroupLabel(row.createdAt, now);
+    const groupRows = rowsByLabel.get(label);
+    if (groupRows) {
+      groupRows.push(row);
+    } else {
+      rowsByLabel.set(label, [row]);
+    }
+  }
+
+  return Array.from(rowsByLabel, ([label, groupRows]) => ({ label, rows: groupRows }));
+}
+
 function countWords(text: string) {
   return text.trim().split(/\s+/).filter(Boolean).length;
 }
@@ -877,6 +978,7 @@ function readBlobAsDataUrl(blob: Blob) {
 function useMicrophoneWaveform(active: boolean) {
   const frameRef = useRef<number[]>(idleWaveformFrame);
   const lastOverlayFrameAtRef = useRef(0);
+  const overlayIdleRef = useRef(true);
   const audioLevelRef = useRef(0);
 
   useEffect(() => {
@@ -888,6 +990,7 @@ function useMicrophoneWaveform(active: boolean) {
   useEffect(() => {
     if (!active) {
       frameRef.current = idleWaveformFrame;
+      overlayIdleRef.current = true;
       sendOverlayWaveformFrame(idleWaveformFrame, false);
       return undefined;
     }
@@ -906,8 +1009,9 @@ function useMicrophoneWaveform(active: boolean) {
           frameRef.current = idleWaveformFrame;
         }
 
-        if (timestamp - lastOverlayFrameAtRef.current > 120) {
+        if (!overlayIdleRef.current) {
           sendOverlayWaveformFrame(idleWaveformFrame, false);
+          overlayIdleRef.current = true;
           lastOverlayFrameAtRef.current = timestamp;
         }
       } else {
@@ -921,6 +1025,7 @@ function useMicrophoneWaveform(active: boolean) {
 
         if (timestamp - lastOverlayFrameAtRef.current > 16) {
           sendOverlayWaveformFrame(nextFrame, true);
+          overlayIdleRef.current = false;
           lastOverlayFrameAtRef.current = timestamp;
         }
       }
@@ -934,6 +1039,7 @@ function useMicrophoneWaveform(active: boolean) {
       stopped = true;
       if (animationFrame) cancelWaveformFrame(animationFrame);
       frameRef.current = idleWaveformFrame;
+      overlayIdleRef.current = true;
       sendOverlayWaveformFrame(idleWaveformFrame, false);
     };
   }, [active]);
@@ -968,6 +1074,7 @@ function App() {
   const recordingTransitionRef = useRef<"starting" | "stopping" | null>(null);
   const runtimeStateLoadedRef = useRef(false);
   const scrollbarTimerRef = useRef<number | null>(null);
+  const scrollbarHideAtRef = useRef(0);
   const overlayPlacementTouchedRef = useRef(false);
   const modelActionIdsRef = useRef<Set<string>>(new Set());
   useMicrophoneWaveform(isRecording);
@@ -1019,14 +1126,21 @@ function App() {
 
   const showScrollbarTemporarily = useCallback((durationMs = 1200) => {
     setIsScrollbarVisible(true);
-    if (scrollbarTimerRef.current) {
-      window.clearTimeout(scrollbarTimerRef.current);
-    }
+    scrollbarHideAtRef.current = Date.now() + durationMs;
+    if (scrollbarTimerRef.current) return;
+
+    const hideScrollbarWhenIdle = () => {
+      const remainingMs = scrollbarHideAtRef.current - Date.now();
+      if (remainingMs > 0) {
+        scrollbarTimerRef.current = window.setTimeout(hideScrollbarWhenIdle, remainingMs);
+        return;
+      }
 
-    scrollbarTimerRef.current = window.setTimeout(() => {
       setIsScrollbarVisible(false);
       scrollbarTimerRef.current = null;
-    }, durationMs);
+    };
+
+    scrollbarTimerRef.current = window.setTimeout(hideScrollbarWhenIdle, durationMs);
   }, []);
 
   const syncRecordingBridge = useCallback(async (active: boolean) => {
@@ -1537,11 +1651,11 @@ function App() {
     }
   }, []);
 
-  const activeTitle = useMemo(() => navItems.find((item) => item.id === activeView)?.label ?? "Home", [activeView]);
+  const activeTitle = navItemLabelById[activeView] ?? "Home";
 
-  const handleWindowAction = (action: WindowAction) => {
+  const handleWindowAction = useCallback((action: WindowAction) => {
     void window.asrpro?.windowControl(action);
-  };
+  }, []);
 
   const handleSetRecording = useCallback((active: boolean) => {
     if (active) {
@@ -1551,6 +1665,14 @@ function App() {
     }
   }, [startRecordingFlow, stopRecordingFlow]);
 
+  const handleToggleRecording = useCallback(() => {
+    handleSetRecording(!isRecording);
+  }, [handleSetRecording, isRecording]);
+
+  const openHistoryView = useCallback(() => setActiveView("history"), []);
+  const openModelsView = useCallback(() => setActiveView("models"), []);
+  const openSoundView = useCallback(() => setActiveView("sound"), []);
+
   const handleScrollActivity = useCallback(() => {
     showScrollbarTemporarily(1100);
   }, [showScrollbarTemporarily]);
@@ -1596,9 +1718,9 @@ function App() {
                 selectedModel={selectedModel}
                 historyRows={historyRows}
                 shortcut={runtimeInfo?.shortcut}
-                onToggleRecording={() => handleSetRecording(!isRecording)}
-                onOpenHistory={() => setActiveView("history")}
-                onOpenModels={() => setActiveView("models")}
+                onToggleRecording={handleToggleRecording}
+                onOpenHistory={openHistoryView}
+                onOpenModels={openModelsView}
               />
             )}
             {activeView === "sound" && (
@@ -1612,7 +1734,7 @@ function App() {
                 audioInputDevicesError={audioInputDevicesError}
                 onSelectAudioInput={handleAudioInputChange}
                 onRefreshAudioInputs={refreshAudioInputDevices}
-                onOpenModels={() => setActiveView("models")}
+                onOpenModels={openModelsView}
               />
             )}
             {activeView === "models" && (
@@ -1656,8 +1778,8 @@ function App() {
                 onTextEditorChange={handleTextEditorChange}
                 onAutoCopyTranscriptsChange={handleAutoCopyTranscriptsChange}
                 onStartupLaunchChange={handleStartupLaunchChange}
-                onOpenModels={() => setActiveView("models")}
-                onOpenSound={() => setActiveView("sound")}
+                onOpenModels={openModelsView}
+                onOpenSound={openSoundView}
               />
             )}
           </main>
@@ -1694,84 +1816,79 @@ interface SidebarProps {
   onWindowAction: (action: WindowAction) => void;
 }
 
-function Sidebar({ activeView, onChange, onWindowAction }: SidebarProps) {
+const Sidebar = memo(function Sidebar({ activeView, onChange, onWindowAction }: SidebarProps) {
+  const handleNavClick = useCallback((event: MouseEvent<HTMLElement>) => {
+    const viewId = (event.target as Element).closest<HTMLElement>("[data-view-id]")?.dataset.viewId;
+    if (viewId && viewId in navItemLabelById) {
+      onChange(viewId as ViewId);
+    }
+  }, [onChange]);
+
   return (
-    <aside className="flex min-h-0 flex-col border-b border-[#545454] bg-[#3c3c3c] text-[#d8d8d8] sm:border-b-0">
+    <aside className="flex min-h-0 flex-col border-b border-[#545454] bg-[#3c3c3c] text-[#d8d8d8] [contain:content] sm:border-b-0">
       <div className="flex h-12 items-center gap-3 px-4 [-webkit-app-region:drag]">
         <WindowDots onWindowAction={onWindowAction} />
       </div>
 
-      <nav className="scrollbar-macos flex gap-1 overflow-x-auto px-2.5 pb-3 pt-1 sm:block sm:min-h-0 sm:overflow-y-auto" aria-label="Primary">
-        {navItems.map((item) => {
-          const Icon = item.icon;
-          const isActive = activeView === item.id;
-
-          return (
-            <button
-              key={item.id}
-              type="button"
-              aria-label={item.label}
-              aria-current={isActive ? "page" : undefined}
-              className={`mb-1 flex h-9 shrink-0 items-center gap-2 rounded-[9px] px-2.5 text-left text-[13px] font-semibold transition outline-none focus:outline-none focus-visible:ring-2 focus-visible:ring-[#9bcfff]/70 focus-visible:ring-offset-1 focus-visible:ring-offset-[#3c3c3c] sm:w-full ${
-                isActive
-                  ? "bg-[#686868] text-white"
-                  : "text-[#d0d0d0] hover:bg-[#505050]"
-              }`}
-              onClick={() => onChange(item.id)}
-            >
-              <span className={`grid size-5 shrink-0 place-items-center rounded-md ${sidebarIconTone[item.id]}`}>
-                <Icon className="size-3.5" />
-              </span>
-              <span>{item.label}</span>
-            </button>
-          );
-        })}
+      <nav
+        className="scrollbar-macos flex gap-1 overflow-x-auto px-2.5 pb-3 pt-1 sm:block sm:min-h-0 sm:overflow-y-auto"
+        aria-label="Primary"
+        onClick={handleNavClick}
+      >
+        {navItems.map((item) => (
+          <SidebarNavItem key={item.id} item={item} isActive={activeView === item.id} />
+        ))}
       </nav>
     </aside>
   );
+});
+
+interface SidebarNavItemProps {
+  item: NavItem;
+  isActive: boolean;
 }
 
+const SidebarNavItem = memo(function SidebarNavItem({ item, isActive }: SidebarNavItemProps) {
+  return (
+    <button
+      type="button"
+      aria-label={item.label}
+      aria-current={isActive ? "page" : undefined}
+      className={sidebarNavItemClass}
+      data-view-id={item.id}
+    >
+      <span className={sidebarIconTileClassById[item.id]}>{sidebarNavIconById[item.id]}</span>
+      {item.label}
+    </button>
+  );
+});
+
 interface WindowDotsProps {
   onWindowAction: (action: WindowAction) => void;
 }
 
-function WindowDots({ onWindowAction }: WindowDotsProps) {
-  const dotButtonClass =
-    "grid size-[13px] place-items-center rounded-full border-0 p-0 shadow-none outline-none transition-transform duration-150 [appearance:none] hover:scale-105 focus:outline-none focus-visible:outline-none focus-visible:ring-0 active:outline-none";
-  const dotIconClass =
-    "size-[9px] opacity-0 transition-opacity duration-100 group-hover/window-dots:opacity-75";
+const WindowDots = memo(function WindowDots({ onWindowAction }: WindowDotsProps) {
+  const handleDotClick = useCallback((event: MouseEvent<HTMLButtonElement>) => {
+    onWindowAction(event.currentTarget.dataset.windowAction as WindowAction);
+  }, [onWindowAction]);
 
   return (
     <div className="group/window-dots flex shrink-0 items-center gap-[7px] [-webkit-app-region:no-drag]">
-      <button
-        aria-label="Close window"
-        className={`${dotButtonClass} bg-[#ff5f57]`}
-        type="button"
-        onClick={() => onWindowAction("close")}
-      >
-        <X
-          aria-hidden="true"
-          data-window-dot-icon="close"
-          strokeWidth={2.6}
-          className={`${dotIconClass} text-[#6e140f]`}
-        />
-      </button>
-      <button
-        aria-label="Minimize window"
-        className={`${dotButtonClass} bg-[#febc2e]`}
-        type="button"
-        onClick={() => onWindowAction("minimize")}
-      >
-        <Minus
-          aria-hidden="true"
-          data-window-dot-icon="minimize"
-          strokeWidth={3}
-          className={`${dotIconClass} text-[#8f5b00]`}
-        />
-      </button>
+      {windowDots.map(({ action, label, buttonClass, icon }) => (
+        <button
+          key={action}
+          aria-label={label}
+          className={buttonClass}
+          data-window-action={action}
+          type="button"
+          onClick={handleDotClick}
+        >
+          {icon}
+        </button>
+      ))}
     </div>
   );
-}
+});
 
 interface ToolbarProps {
   activeTitle: string;
@@ -1868,7 +1985,7 @@ function HomeView({
         <h2 className="mb-3 text-[13px] font-semibold text-[#a9a9a9]">Get started</h2>
         <div className="space-y-2">
           <HomeActionRow
-            icon={<Mic2 className="size-3.5" />}
+            icon={panelRowIcons.microphone}
             title={recordingTitle}
             detail={statusDetail}
             disabled={isBusy}
@@ -1876,8 +1993,8 @@ function HomeView({
             ariaLabel={recordingActionLabel}
             onClick={onToggleRecording}
           />
-          <HomeActionRow icon={<History className="size-3.5" />} title="Review history" detail="Replay saved recordings and transcripts." onClick={onOpenHistory} />
-          <HomeActionRow icon={<Library className="size-3.5" />} title="Choose speech model" detail={selectedModel} onClick={onOpenModels} />
+          <HomeActionRow icon={panelRowIcons.history} title="Review history" detail="Replay saved recordings and transcripts." onClick={onOpenHistory} />
+          <HomeActionRow icon={panelRowIcons.models} title="Choose speech model" detail={selectedModel} onClick={onOpenModels} />
         </div>
       </section>
 
@@ -2022,7 +2139,7 @@ function DropdownOptionButton({ selected, className = "", children, ...props }:
       role="option"
       aria-selected={selected}
       {...props}
-      className={`${dropdownOptionButtonClass} ${selected ? "bg-[#5a5a5a] text-white" : "text-[#dddddd] hover:bg-[#454545]"} ${className}`}
+      className={`${selected ? dropdownOptionButtonClassByState.selected : dropdownOptionButtonClassByState.idle} ${className}`}
     >
       {children}
     </button>
@@ -2058,7 +2175,7 @@ function SegmentedControl<TValue extends string>({ value, options, onChange }: S
             type="button"
             aria-label={option.ariaLabel}
             aria-pressed={active}
-            className={`${segmentedItemClass} ${active ? "bg-[#686868] text-white" : "text-[#aaa] hover:text-white"}`}
+            className={active ? segmentedItemClassByState.active : segmentedItemClassByState.idle}
             onClick={() => onChange(option.value)}
           >
             {option.label}
@@ -2206,7 +2323,7 @@ function SoundView({
     <ViewFrame title="Sound">
       <GroupedPanel title="Input" allowOverflow>
         <PanelRow
-          icon={<Mic2 className="size-3.5" />}
+          icon={panelRowIcons.microphone}
           title="Microphone"
           detail={isRecording ? `Recording with ${selectedAudioInputLabel}` : selectedAudioInputLabel}
           trailing={<StatusLabel>{isRecording ? "Live" : selectedAudioInputId === defaultAudioInputId ? "Default" : "Ready"}</StatusLabel>}
@@ -2242,7 +2359,7 @@ function SoundView({
           )}
         />
         <PanelRow
-          icon={<BrainCircuit className="size-3.5" />}
+          icon={panelRowIcons.engine}
           title="Recognition model"
           detail={selectedModel}
           trailing={<NavigateButton label="Change" onClick={onOpenModels} />}
@@ -2435,16 +2552,12 @@ interface ModelActionButtonProps {
 
 function ModelActionButton({ ariaLabel, busy, kind, onClick }: ModelActionButtonProps) {
   const Icon = busy ? RefreshCw : kind === "delete" ? Trash2 : Download;
-  const toneClass = kind === "delete"
-    ? "text-[#cfcfcf] hover:bg-[#4a3333] hover:text-[#ffb3aa]"
-    : "text-[#cfcfcf] hover:bg-[#344235] hover:text-[#bce7c9]";
-
   return (
     <HoverPopover content={kind === "delete" ? "Delete model" : "Download model"}>
       <button
         type="button"
         aria-label={ariaLabel}
-        className={`grid size-8 shrink-0 place-items-center rounded-full border-0 bg-transparent p-0 transition active:scale-[0.96] disabled:cursor-wait disabled:opacity-55 ${toneClass} ${focusRingClass}`}
+        className={modelActionButtonClassByKind[kind]}
         disabled={busy}
         onClick={onClick}
       >
@@ -2490,7 +2603,7 @@ function ResourceStatsPanel({ stats }: { stats?: RuntimeStorageStats }) {
       ) : (
         <div className="p-4">
           <PanelRow
-            icon={<HardDrive className="size-3.5" />}
+            icon={panelRowIcons.storage}
             title="Runtime stats"
             detail="Waiting for desktop storage and memory details"
             trailing={<StatusLabel>Pending</StatusLabel>}
@@ -2521,16 +2634,7 @@ function HistoryView({ rows, onCopyRow, onReprocessRow, onOpenTranscriptRow, onD
     || row.text.toLowerCase().includes(normalizedQuery)
     || row.model.toLowerCase().includes(normalizedQuery)
   ));
-  const groupedRows = filteredRows.reduce<Array<{ label: string; rows: TranscriptHistoryRow[] }>>((groups, row) => {
-    const label = formatHistoryGroupLabel(row.createdAt);
-    const group = groups.find((item) => item.label === label);
-    if (group) {
-      group.rows.push(row);
-    } else {
-      groups.push({ label, rows: [row] });
-    }
-    return groups;
-  }, []);
+  const groupedRows = groupHistoryRowsByDay(filteredRows);
 
   useEffect(() => {
     setExpandedRowId((current) => {
@@ -2606,7 +2710,7 @@ function HistoryCard({ row, expanded, onCopy, onReprocess, onOpenTranscript, onD
   const canOpenTranscript = Boolean(row.text.trim());
 
   return (
-    <article className={`${panelSurfaceClass} p-4 transition-colors duration-200 ${expanded ? "bg-white/[0.07]" : ""}`}>
+    <article className={`${panelSurfaceClass} p-4 transition-colors duration-200 [contain-intrinsic-size:auto_54px] [content-visibility:auto] ${expanded ? "bg-white/[0.07]" : ""}`}>
       <button
         type="button"
         className="block w-full text-left"
@@ -2727,7 +2831,7 @@ function HistoryRecordingPlayer({ title, src }: HistoryRecordingPlayerProps) {
           <span
             key={bar.id}
             className="w-px shrink-0 rounded-full bg-[#a9a9a9]"
-            style={{ height: `${bar.height}px`, opacity: bar.index % 4 === 0 ? 0.35 : 0.62 }}
+            style={bar.style}
           />
         ))}
       </div>
@@ -2858,6 +2962,9 @@ function formatEngineStatus(status?: string) {
   return "Unknown";
 }
 
+const aboutBrandTileStyle = { background: "linear-gradient(145deg, #20272d, #10171d 50%, #04070a)" };
+const aboutBrandLogoMark = <AppLogoMark className="size-16 opacity-[0.88]" title="ASR Pro" />;
+
 interface AboutViewProps {
   appInfo: AppInfo;
   storagePath?: string;
@@ -2873,9 +2980,9 @@ function AboutView({ appInfo, storagePath }: AboutViewProps) {
           <div
             data-brand-icon-surface="ink-slate"
             className="grid size-[72px] shrink-0 place-items-center rounded-[16px] text-[#eef4f5] shadow-[inset_0_1px_0_rgba(255,255,255,0.2),inset_0_-16px_24px_rgba(0,0,0,0.45)]"
-            style={{ background: "linear-gradient(145deg, #20272d, #10171d 50%, #04070a)" }}
+            style={aboutBrandTileStyle}
           >
-            <AppLogoMark className="size-16 opacity-[0.88]" title="ASR Pro" />
+            {aboutBrandLogoMark}
           </div>
           <div className="min-w-0">
             <h3 className="text-[24px] font-semibold leading-7 tracking-normal text-[#f4f4f4]">{appInfo.name}</h3>
@@ -2945,13 +3052,10 @@ function ToggleSwitch({ label, checked, disabled = false, onChange }: ToggleSwit
       aria-checked={checked}
       aria-label={label}
       disabled={disabled}
-      className={`relative h-6 w-11 shrink-0 rounded-full border border-white/[0.1] transition ${focusRingClass} ${disabled ? "cursor-not-allowed opacity-50" : ""} ${checked ? "bg-[#5f9fc6]/70" : "bg-[#2b2b2b]"}`}
+      className={toggleSwitchClass}
       onClick={() => onChange(!checked)}
     >
-      <span
-        aria-hidden="true"
-        className={`absolute left-[3px] top-[3px] size-[18px] rounded-full bg-[#f1f1f1] shadow-[0_1px_4px_rgba(0,0,0,0.35)] transition-transform ${checked ? "translate-x-5" : "translate-x-0"}`}
-      />
+      <span aria-hidden="true" className={toggleSwitchThumbClass} />
     </button>
   );
 }
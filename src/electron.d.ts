@@ -156,7 +156,7 @@ declare global {
       }>;
       setRecording: (active: boolean) => Promise<{ isRecording: boolean }>;
       toggleRecording: () => Promise<{ isRecording: boolean }>;
-      setWaveformFrame?: (frame: number[]) => void;
+      setWaveformFrame?: (frame: readonly number[]) => void;
       onRecordingState: (callback: (state: { isRecording: boolean; source: string }) => void) => () => void;
       onEngineState?: (callback: (state: EngineState) => void) => () => void;
       windowControl: (action: "minimize" | "close") => Promise<void>;
@@ -186,6 +186,53 @@ describe("Electron runtime helpers", () => {
     }
   });
 
+  it("reports each model download percentage only once", async () => {
+    const dataDir = mkdtempSync(path.join(tmpdir(), "asrpro-model-download-progress-"));
+    const model = whisperEngine.AVAILABLE_MODELS.find((candidate: { id: string }) => candidate.id === "whisper-tiny-en");
+    const originalSha1 = model.sha1;
+    const payload = Buffer.alloc(1000, 7);
+    model.sha1 = createHash("sha1").update(payload).digest("hex");
+    const reportedProgress: number[] = [];
+
+    vi.spyOn(https, "get").mockImplementation(((_url: string | URL, callback: (response: Readable) => void) => {
+      const request = new EventEmitter();
+      const response = new Readable({
+        read() {},
+      }) as Readable & {
+        statusCode?: number;
+        headers: Record<string, string>;
+      };
+      response.statusCode = 200;
+      response.headers = { "content-length": String(payload.length) };
+
+      setTimeout(() => {
+        callback(response);
+        for (let offset = 0; offset < payload.length; offset += 1) {
+          response.push(payload.subarray(offset, offset + 1));
+        }
+        response.push(null);
+      }, 0);
+
+      return request;
+    }) as typeof https.get);
+
+    try {
+      await whisperEngine.downloadModelFile({
+        modelId: model.id,
+        dataDir,
+        onState: (state: { progress?: number }) => {
+          if (typeof state.progress === "number") reportedProgress.push(state.progress);
+        },
+      });
+
+      expect(reportedProgress[reportedProgress.length - 1]).toBe(100);
+      expect(new Set(reportedProgress).size).toBe(reportedProgress.length);
+    } finally {
+      model.sha1 = originalSha1;
+      rmSync(dataDir, { recursive: true, force: true });
+    }
+  });
+
   it("opens history transcript text through Electron IPC", () => {
     const mainSource = readFileSync("electron/main.cjs", "utf8");
     const preloadSource = readFileSync("electron/preload.cjs", "utf8");
@@ -265,6 +312,7 @@ describe("Electron runtime helpers", () => {
     expect(html).toContain("now - lastInputAt > 260");
     expect(html).toContain("desired > current[index] ? 0.34 : 0.2");
     expect(html).toContain("Math.sin(now * 0.018");
+    expect(html).toContain("renderedHeights[index] !== nextHeight");
     expect(html).toContain("rgba(18, 18, 20, 0.94)");
     expect(html).toContain("rgba(230, 230, 234, var(--bar-opacity))");
     expect(html).toContain("asrproSetWaveformFrame");